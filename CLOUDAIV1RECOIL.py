@@ -1,12 +1,14 @@
 import sys
 import threading
 import time
+import ctypes
 import random
 import winsound
 import json
+import base64
 import os
-import win32api
 import win32con
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List, Dict
 
 try:
@@ -16,24 +18,134 @@ try:
 except ImportError:
     HAVE_PYSERIAL = False
 
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QPushButton, QVBoxLayout,
                              QHBoxLayout, QSlider, QCheckBox, QColorDialog)
 from PyQt5.QtCore import (Qt, QPoint, QRect, QRectF, QPropertyAnimation, QTimer,
-                          QUrl, QEasingCurve, pyqtSignal, QObject, QByteArray, QSize)
+                          QUrl, QEasingCurve, pyqtSignal, QObject, QSize,
+                          QStandardPaths)
 from PyQt5.QtGui import (QFont, QColor, QPainter, QPainterPath, QPixmap, QIcon,
                          QDesktopServices, QPen)
-from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
-from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest
 
 IMGUR_CHECK_URL = 'https://i.imgur.com/i6bI5Xn.png'
 IMGUR_CLOSE_URL = 'https://i.imgur.com/cC8a7sp.png'
 DISCORD_INVITE_URL = 'https://discord.gg/jEdCd7Vfqt'
 
-DISCORD_SVG = """
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 127.14 96.36">
-  <path fill="#5865F2" d="M107.7,8.07A105.15,105.15,0,0,0,81.47,0a72.06,72.06,0,0,0-3.36,6.83A97.68,97.68,0,0,0,49,6.83,72.37,72.37,0,0,0,45.64,0,105.89,105.89,0,0,0,19.39,8.09C2.79,32.65-1.71,56.6.54,80.21h0A105.73,105.73,0,0,0,32.71,96.36,77.7,77.7,0,0,0,39.6,85.25a68.42,68.42,0,0,1-10.85-5.18c.91-.66,1.8-1.34,2.66-2a75.57,75.57,0,0,0,64.32,0c.85.71,1.76,1.39,2.66,2a68.68,68.68,0,0,1-10.87,5.19,77,77,0,0,0,6.89,11.1A105.25,105.25,0,0,0,126.6,80.22h0C129.24,52.84,122.09,29.11,107.7,8.07ZM42.45,65.69C36.18,65.69,31,60,31,53s5-12.74,11.43-12.74S54,46,53.89,53,48.84,65.69,42.45,65.69Zm42.24,0C78.41,65.69,73.25,60,73.25,53s5-12.74,11.44-12.74S96.23,46,96.12,53,91.08,65.69,84.69,65.69Z"/>
-</svg>
-"""
+# Direct user32 bindings for the polling hot path: pywin32 routes every call
+# through a Python-C marshalling shim, which adds up at ~500 Hz.
+_user32 = ctypes.WinDLL('user32', use_last_error=False)
+_GetAsyncKeyState = _user32.GetAsyncKeyState
+_GetAsyncKeyState.argtypes = [ctypes.c_int]
+_GetAsyncKeyState.restype = ctypes.c_short
+_mouse_event = _user32.mouse_event
+_mouse_event.argtypes = [ctypes.c_uint, ctypes.c_int, ctypes.c_int,
+                         ctypes.c_uint, ctypes.c_void_p]
+_mouse_event.restype = None
+
+# Raw WriteFile binding for the MAKCU write path; pyserial's write() adds
+# ClearCommError/overlapped bookkeeping around every call.
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_WriteFile = _kernel32.WriteFile
+_WriteFile.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_ulong,
+                       ctypes.POINTER(ctypes.c_ulong), ctypes.c_void_p]
+_WriteFile.restype = ctypes.c_int
+_SetCommTimeouts = _kernel32.SetCommTimeouts
+_SetupComm = _kernel32.SetupComm
+_SetupComm.argtypes = [ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong]
+_SetupComm.restype = ctypes.c_int
+_CreateFileW = _kernel32.CreateFileW
+_CreateFileW.argtypes = [ctypes.c_wchar_p, ctypes.c_ulong, ctypes.c_ulong,
+                         ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong,
+                         ctypes.c_void_p]
+_CreateFileW.restype = ctypes.c_void_p
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [ctypes.c_void_p]
+_CloseHandle.restype = ctypes.c_int
+
+_GENERIC_READ = 0x80000000
+_GENERIC_WRITE = 0x40000000
+_OPEN_EXISTING = 3
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class COMMTIMEOUTS(ctypes.Structure):
+    _fields_ = [
+        ("ReadIntervalTimeout", ctypes.c_ulong),
+        ("ReadTotalTimeoutMultiplier", ctypes.c_ulong),
+        ("ReadTotalTimeoutConstant", ctypes.c_ulong),
+        ("WriteTotalTimeoutMultiplier", ctypes.c_ulong),
+        ("WriteTotalTimeoutConstant", ctypes.c_ulong),
+    ]
+
+
+_SetCommTimeouts.argtypes = [ctypes.c_void_p, ctypes.POINTER(COMMTIMEOUTS)]
+_SetCommTimeouts.restype = ctypes.c_int
+
+
+class DCB(ctypes.Structure):
+    _fields_ = [
+        ("DCBlength", ctypes.c_ulong),
+        ("BaudRate", ctypes.c_ulong),
+        ("fBinary", ctypes.c_ulong, 1),
+        ("fParity", ctypes.c_ulong, 1),
+        ("fOutxCtsFlow", ctypes.c_ulong, 1),
+        ("fOutxDsrFlow", ctypes.c_ulong, 1),
+        ("fDtrControl", ctypes.c_ulong, 2),
+        ("fDsrSensitivity", ctypes.c_ulong, 1),
+        ("fTXContinueOnXoff", ctypes.c_ulong, 1),
+        ("fOutX", ctypes.c_ulong, 1),
+        ("fInX", ctypes.c_ulong, 1),
+        ("fErrorChar", ctypes.c_ulong, 1),
+        ("fNull", ctypes.c_ulong, 1),
+        ("fRtsControl", ctypes.c_ulong, 2),
+        ("fAbortOnError", ctypes.c_ulong, 1),
+        ("fDummy2", ctypes.c_ulong, 17),
+        ("wReserved", ctypes.c_ushort),
+        ("XonLim", ctypes.c_ushort),
+        ("XoffLim", ctypes.c_ushort),
+        ("ByteSize", ctypes.c_ubyte),
+        ("Parity", ctypes.c_ubyte),
+        ("StopBits", ctypes.c_ubyte),
+        ("XonChar", ctypes.c_char),
+        ("XoffChar", ctypes.c_char),
+        ("ErrorChar", ctypes.c_char),
+        ("EofChar", ctypes.c_char),
+        ("EvtChar", ctypes.c_char),
+        ("wReserved1", ctypes.c_ushort),
+    ]
+
+
+_GetCommState = _kernel32.GetCommState
+_GetCommState.argtypes = [ctypes.c_void_p, ctypes.POINTER(DCB)]
+_GetCommState.restype = ctypes.c_int
+_SetCommState = _kernel32.SetCommState
+_SetCommState.argtypes = [ctypes.c_void_p, ctypes.POINTER(DCB)]
+_SetCommState.restype = ctypes.c_int
+
+# 22x22 Discord logo pre-rendered from the upstream SVG, so startup loads a
+# PNG directly instead of parsing XML through QSvgRenderer (and QtSvg is no
+# longer needed at all).
+DISCORD_ICON_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAABYAAAAWCAYAAADEtGw7AAAACXBIWXMAAA9hAAAPYQGoP6dp"
+    "AAACbUlEQVQ4ja2UTUiUURSGn/eOLixnDNpoEZkbF0ULwaAoxFSIsJLCdFooOM20kKAfInIf"
+    "tHLR38IxCqHGH9pERQup0E3kom1bibDISCc1Gme+02b+dCahxnd1z33vec45l/t9oojOhRYP"
+    "pHwuKLP2VLk7MnG/8ku+3923vANfakrouWfe6Nhw1bv1DOUHXeHFRuFugrXldm1c0qxBTTph"
+    "zjyrRerMQWzSg4GxaNVMATgSsfK4/ZwlDfgPzaUW/LUTE0oAuMzuoi2dKQEKUOPbFu/KBFmw"
+    "sIslQDO4S2vAXZGFBuBQ6WBrCF6IH8yCZS5YOjSN9jiRBSNr2SwwsmMA6umPb08k+Ma6p1eC"
+    "rNynapf4reZiUMGgh2uTMVUkedrDtQkGi/WcTHotZSZrXE8VNhmLVl0F6OmPf0gk+ARUpO1f"
+    "EqfHhyrngclgeHG/odY1LTvqnWS7C4fhRWY5ci/wXcZMnvs+NhSYz3WhV4X5qnOYdhUO4xJr"
+    "69hqnrmBl1WdQ1YANjicWbdHPm9BasiZ1tB52SqysZc7m6c96g7HV8jdX0YpiVByVS99ZXYL"
+    "6FszkHiYXNX1snI7bsYDwLcuf1nd4fgSsLVI1VKUdEByk6EA5rCi4KV/gBQ7u+LkeFZQTnZD"
+    "HieBt3+jCd4Ap4QNFLGfuthQoA+4BqSySaY75ugYjQaaZa7ac2qSCEuEPacmmauORQNHJToM"
+    "3c4DppBdGY0GQtmP7mx4qdUn764Z9QBm1js2XDWy0R0EI/FeMx6lw48y9ceG/a8h70c/Hq2c"
+    "TP7w78U4D0x/3Rl4shEUYK7G/xiYBkKpBf++DBTgD6w24AiHIUWQAAAAAElFTkSuQmCC"
+)
 
 STYLES = {
     "window_background": QColor(20, 20, 20, 240),
@@ -68,25 +180,22 @@ STYLES = {
         }"""
 }
 
-def svg_to_pixmap(svg_data: str, size: QSize) -> QPixmap:
-    renderer = QSvgRenderer(QByteArray(svg_data.encode('utf-8')))
-    pixmap = QPixmap(size)
-    pixmap.fill(Qt.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.Antialiasing)
-    renderer.render(painter)
-    painter.end()
+def discord_icon_pixmap() -> QPixmap:
+    pixmap = QPixmap()
+    pixmap.loadFromData(base64.b64decode(DISCORD_ICON_PNG_B64), 'PNG')
     return pixmap
 
 def distribute_movement(total_pixels: int, steps: int) -> List[int]:
     if steps <= 0:
         return []
-    base_move = total_pixels // steps
-    remainder = total_pixels % steps
-    moves = [base_move] * steps
-    for i in range(remainder):
-        moves[i] += 1
-    return moves
+    base_move, remainder = divmod(total_pixels, steps)
+    if HAVE_NUMPY:
+        moves = np.full(steps, base_move, dtype=np.int32)
+        moves[:remainder] += 1
+        return moves.tolist()
+    # Branchless fallback: scatter the remainder via list arithmetic instead
+    # of a per-element Python loop.
+    return [base_move + 1] * remainder + [base_move] * (steps - remainder)
 
 class AsyncImageLoader(QObject):
     _instance = None
@@ -100,6 +209,13 @@ class AsyncImageLoader(QObject):
     def __init__(self):
         super().__init__()
         self.manager = QNetworkAccessManager()
+        # Disk cache persists the tiny imgur assets across runs, turning a
+        # cold start into a local read instead of a TLS handshake + download.
+        disk_cache = QNetworkDiskCache(self)
+        disk_cache.setCacheDirectory(os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.CacheLocation),
+            'cloudrecoil'))
+        self.manager.setCache(disk_cache)
         self.cache: Dict[str, QPixmap] = {}
         self.subscribers: Dict[str, List[QWidget]] = {}
         self.manager.finished.connect(self._on_finished)
@@ -127,7 +243,14 @@ class AsyncImageLoader(QObject):
         
         if url not in self.subscribers:
             self.subscribers[url] = []
-            self.manager.get(QNetworkRequest(QUrl(url)))
+            # The images share one host, so let Qt reuse a single connection
+            # (HTTP/2 or pipelined HTTP/1.1) and serve from cache when fresh.
+            request = QNetworkRequest(QUrl(url))
+            request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+            request.setAttribute(QNetworkRequest.HttpPipeliningAllowedAttribute, True)
+            request.setAttribute(QNetworkRequest.CacheLoadControlAttribute,
+                                 QNetworkRequest.PreferCache)
+            self.manager.get(request)
         
         if subscriber_widget not in self.subscribers[url]:
             self.subscribers[url].append(subscriber_widget)
@@ -150,22 +273,43 @@ class Config:
         'use_makcu': False
     }
 
+    # Parsed-config cache keyed on the file's mtime, so repeat load() calls
+    # (hot-reload, reset) skip the disk read and JSON parse when the file
+    # hasn't changed.
+    _cache: Optional[dict] = None
+    _cache_mtime: Optional[float] = None
+
     @classmethod
     def load(cls) -> dict:
         try:
-            if os.path.exists(cls.CONFIG_PATH):
+            mtime = os.path.getmtime(cls.CONFIG_PATH)
+        except OSError:
+            mtime = None
+
+        if cls._cache is not None and cls._cache_mtime == mtime:
+            return cls._cache.copy()
+
+        merged = cls.DEFAULTS.copy()
+        if mtime is not None:
+            try:
                 with open(cls.CONFIG_PATH, 'r') as f:
+                    merged.update(json.load(f))
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"[Config Error] Could not load config file: {e}")
+                return cls.DEFAULTS.copy()
 
-                    return {**cls.DEFAULTS, **json.load(f)}
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"[Config Error] Could not load config file: {e}")
-        return cls.DEFAULTS.copy()
+        cls._cache = merged
+        cls._cache_mtime = mtime
+        return merged.copy()
 
     @classmethod
     def save(cls, settings: dict):
         try:
             with open(cls.CONFIG_PATH, 'w') as f:
                 json.dump(settings, f, indent=4)
+                f.flush()
+            cls._cache = settings.copy()
+            cls._cache_mtime = os.path.getmtime(cls.CONFIG_PATH)
         except IOError as e:
             print(f"[Config Error] Could not save config file: {e}")
 
@@ -173,17 +317,30 @@ class AppState:
     def __init__(self, initial_settings: dict):
         self.lock = threading.Lock()
         self.settings = initial_settings.copy()
-        self.fps = 0
         self.running = True
+        self._gen = 0
 
     def update(self, new_settings: dict):
         with self.lock:
             self.settings.update(new_settings)
+            self._gen += 1
 
     def get_full_config(self) -> dict:
         with self.lock:
             return self.settings.copy()
 
+    def get_if_changed(self, last_gen: int):
+        """Return (gen, snapshot) — snapshot is None when nothing changed.
+
+        Settings change at UI cadence while the recoil loop ticks every 2 ms,
+        so callers keep their last copy and only pay the dict copy when the
+        generation counter has advanced.
+        """
+        with self.lock:
+            if self._gen == last_gen:
+                return last_gen, None
+            return self._gen, self.settings.copy()
+
 class MakcuController:
     
     DEVICE_PROFILES = {
@@ -209,43 +366,85 @@ class MakcuController:
         self.serial: Optional[serial.Serial] = None
         self.connected = False
         self.port_name: Optional[str] = None
+        self._handle = None
+        self._bytes_written = ctypes.c_ulong(0)
+        # Pre-rendered ASCII for the movement range the recoil settings can
+        # produce, so move() concatenates cached fragments instead of running
+        # printf-style formatting per command.
+        self._digit_cache = {i: b"%d" % i for i in range(-32, 33)}
     
     def connect(self) -> bool:
         if not HAVE_PYSERIAL:
             return False
-        
+
         self.close()
-        
+
         ports = list_ports.comports()
-        for port in ports:
-            for profile_name, profile in self.DEVICE_PROFILES.items():
-                try:
-                    self.serial = serial.Serial(
-                        port.device, 
-                        self.BAUDRATE_DEFAULT, 
-                        timeout=0.5, 
-                        write_timeout=0.1
-                    )
-                    time.sleep(0.5)
-                    
-                    self.serial.write(profile["HANDSHAKE_COMMAND"])
-                    time.sleep(0.2)
-                    response = self._read_response()
-                    
-                    if any(keyword in response for keyword in profile["HANDSHAKE_RESPONSE_KEYWORDS"]):
-                        print(f"[MAKCU] Found {profile_name} on {port.device}. Finalizing connection...")
-                        self._finalize_connection(port.device, profile)
-                        return True
-                    else:
-                        self.serial.close()
-                except (OSError, serial.SerialException):
-                    if self.serial and self.serial.is_open:
-                        self.serial.close()
+        # Probing a port costs ~0.7 s of handshake sleeps, so ports that are
+        # clearly not USB serial adapters (no VID) are skipped up front --
+        # unless that filter would leave nothing to try.
+        candidates = [p.device for p in ports if p.vid is not None]
+        candidates = candidates or [p.device for p in ports]
+        if not candidates:
+            print("[MAKCU] No supported hardware found.")
+            return False
+
+        # Handshake all candidates concurrently; the first port that answers
+        # wins and the remaining probes are cancelled or closed as they land.
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            futures = [executor.submit(self._probe, device) for device in candidates]
+            for future in as_completed(futures):
+                # Probes cancelled after the first hit still come through
+                # as_completed; asking them for a result raises CancelledError.
+                if future.cancelled():
                     continue
-        
+                result = future.result()
+                if result is None:
+                    continue
+                probe_serial, profile_name, profile = result
+                if self.connected:
+                    probe_serial.close()
+                    continue
+                self.serial = probe_serial
+                print(f"[MAKCU] Found {profile_name} on {probe_serial.port}. Finalizing connection...")
+                self._finalize_connection(probe_serial.port, profile)
+                for pending in futures:
+                    pending.cancel()
+
+        if self.connected:
+            return True
         print("[MAKCU] No supported hardware found.")
         return False
 
+    def _probe(self, device: str):
+        """Open one port and handshake each profile; return the open port,
+        profile name and profile on a match, None otherwise."""
+        try:
+            probe_serial = serial.Serial(
+                device,
+                self.BAUDRATE_DEFAULT,
+                timeout=0.5,
+                write_timeout=0.1
+            )
+        except (OSError, serial.SerialException):
+            return None
+
+        try:
+            time.sleep(0.5)
+            for profile_name, profile in self.DEVICE_PROFILES.items():
+                probe_serial.write(profile["HANDSHAKE_COMMAND"])
+                time.sleep(0.2)
+                response = self._read_response(probe_serial)
+
+                if any(keyword in response for keyword in profile["HANDSHAKE_RESPONSE_KEYWORDS"]):
+                    return probe_serial, profile_name, profile
+        except (OSError, serial.SerialException):
+            pass
+
+        if probe_serial.is_open:
+            probe_serial.close()
+        return None
+
     def _finalize_connection(self, port_name: str, profile: dict):
         self.port_name = port_name
         
@@ -259,21 +458,84 @@ class MakcuController:
         if profile.get("INIT_COMMAND"):
             self.serial.write(profile["INIT_COMMAND"])
             
-        self.serial.timeout = 0.001
-        self.serial.write_timeout = 0.001
+        # Keep pyserial for the handshake/baud negotiation above, then swap
+        # its handle for a non-overlapped one of our own so move() is one
+        # plain WriteFile syscall instead of pyserial's write machinery.
+        self._handle = self._reopen_nonoverlapped(baud_high)
+        if self._handle is not None:
+            # The reopened handle is ours, not pyserial's, so configure it
+            # directly: a 1 ms total write timeout with no per-byte
+            # multiplier keeps the non-overlapped WriteFile effectively
+            # non-blocking for our tiny commands.
+            timeouts = COMMTIMEOUTS(0, 0, 1, 0, 1)
+            _SetCommTimeouts(self._handle, ctypes.byref(timeouts))
+            # Generous TX buffer so burst writes are absorbed by the driver
+            # instead of blocking the caller.
+            _SetupComm(self._handle, 4096, 16384)
+        else:
+            self.serial.timeout = 0.001
+            self.serial.write_timeout = 0.001
         self.connected = True
-        print(f"[MAKCU] Connected to {self.port_name} at {self.serial.baudrate} baud.")
+        print(f"[MAKCU] Connected to {self.port_name} at {baud_high} baud.")
+
+    def _reopen_nonoverlapped(self, baudrate: int):
+        """Swap pyserial's port handle for a non-overlapped one.
+
+        pyserial opens the port with FILE_FLAG_OVERLAPPED, and calling
+        WriteFile with a NULL OVERLAPPED on such a handle is invalid Win32:
+        it can fail with ERROR_INVALID_PARAMETER or misreport completion.
+        Close the pyserial port, reopen it plainly with CreateFileW, and
+        restore the negotiated line settings; on any failure reopen through
+        pyserial and return None so move() uses the fallback path.
+        """
+        try:
+            self.serial.flush()
+            self.serial.close()
+        except (OSError, serial.SerialException):
+            pass
 
-    def _read_response(self) -> str:
-        lines = []
+        handle = _CreateFileW('\\\\.\\' + self.port_name,
+                              _GENERIC_READ | _GENERIC_WRITE,
+                              0, None, _OPEN_EXISTING, 0, None)
+        if handle is None or handle == _INVALID_HANDLE_VALUE:
+            self._reopen_pyserial()
+            return None
+
+        dcb = DCB()
+        dcb.DCBlength = ctypes.sizeof(DCB)
+        if not _GetCommState(handle, ctypes.byref(dcb)):
+            _CloseHandle(handle)
+            self._reopen_pyserial()
+            return None
+        dcb.BaudRate = baudrate
+        dcb.ByteSize = 8
+        dcb.Parity = 0      # NOPARITY
+        dcb.StopBits = 0    # ONESTOPBIT
+        dcb.fBinary = 1
+        dcb.fDtrControl = 1  # DTR_CONTROL_ENABLE, matching pyserial's open
+        dcb.fRtsControl = 1  # RTS_CONTROL_ENABLE
+        if not _SetCommState(handle, ctypes.byref(dcb)):
+            _CloseHandle(handle)
+            self._reopen_pyserial()
+            return None
+        return handle
+
+    def _reopen_pyserial(self):
         try:
-            while self.serial and self.serial.in_waiting:
-                line = self.serial.readline().decode(errors="ignore").strip()
-                if line:
-                    lines.append(line)
+            self.serial.open()
+        except (OSError, serial.SerialException) as e:
+            print(f"[MAKCU] Could not reopen {self.port_name}: {e}")
+
+    def _read_response(self, port: serial.Serial) -> str:
+        # One bounded read instead of a readline loop: every in_waiting
+        # access crosses into ClearCommError, and the caller has already
+        # waited for the reply, so drain whatever arrived in a single call.
+        try:
+            data = port.read(port.in_waiting or 64)
         except Exception as e:
             print(f"[MAKCU Read Error] {e}")
-        return " ".join(lines).lower()
+            return ""
+        return data.decode('latin-1', 'ignore').lower()
 
     def move(self, x: int, y: int) -> bool:
         if not self.connected or not self.serial:
@@ -282,8 +544,21 @@ class MakcuController:
         if x == 0 and y == 0:
             return True
         
-        command = self.MOVE_CMD_TEMPLATE % (int(x), int(y))
-        
+        digits = self._digit_cache
+        try:
+            command = b"km.move(" + digits[x] + b"," + digits[y] + b")\r"
+        except KeyError:
+            command = self.MOVE_CMD_TEMPLATE % (int(x), int(y))
+
+        if self._handle is not None:
+            if _WriteFile(self._handle, command, len(command),
+                          ctypes.byref(self._bytes_written), None):
+                return True
+            print(f"[MAKCU Write Error] Connection lost: "
+                  f"WriteFile failed (error {ctypes.get_last_error()})")
+            self.connected = False
+            return False
+
         try:
             self.serial.write(command)
             return True
@@ -293,6 +568,9 @@ class MakcuController:
             return False
 
     def close(self):
+        if self._handle is not None:
+            _CloseHandle(self._handle)
+            self._handle = None
         if self.serial and self.serial.is_open:
             self.serial.close()
         self.connected = False
@@ -312,33 +590,48 @@ class CrosshairWindow(QWidget):
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setGeometry(QApplication.desktop().screenGeometry())
         self.config = {}
+        # The crosshair is rasterized into a small sprite once per config
+        # change; painting the fullscreen window is then a single blit. The
+        # window geometry is fixed, so the center never moves either.
+        self._gap = 2
+        self._sprite: Optional[QPixmap] = None
+        self._center = self.rect().center()
 
     def update_crosshair(self, config: dict):
         self.config = config
+        size = config['crosshair_size']
+        thickness = config['crosshair_thickness']
+        gap = self._gap
+
+        side = 2 * (size + gap) + thickness + 2
+        sprite = QPixmap(side, side)
+        sprite.fill(Qt.transparent)
+
+        painter = QPainter(sprite)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(config['crosshair_color']), thickness,
+                            Qt.SolidLine, Qt.RoundCap))
+
+        c = side // 2
+        painter.drawLine(c - size - gap, c, c - gap, c)
+        painter.drawLine(c + gap, c, c + size + gap, c)
+        painter.drawLine(c, c - size - gap, c, c - gap)
+        painter.drawLine(c, c + gap, c, c + size + gap)
+        painter.drawPoint(c, c)
+        painter.end()
+
+        self._sprite = sprite
+        self._center = self.rect().center()
         self.update()
 
     def paintEvent(self, event):
-        if not self.config:
+        if self._sprite is None:
             return
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        center = self.rect().center()
-        color = QColor(self.config['crosshair_color'])
-        size = self.config['crosshair_size']
-        thickness = self.config['crosshair_thickness']
-        gap = 2
-
-        pen = QPen(color, thickness, Qt.SolidLine, Qt.RoundCap)
-        painter.setPen(pen)
-
-        painter.drawLine(center.x() - size - gap, center.y(), center.x() - gap, center.y()) 
-        painter.drawLine(center.x() + gap, center.y(), center.x() + size + gap, center.y()) 
-        painter.drawLine(center.x(), center.y() - size - gap, center.x(), center.y() - gap) 
-        painter.drawLine(center.x(), center.y() + gap, center.x(), center.y() + size + gap) 
-        
-        painter.drawPoint(center)
+        painter.drawPixmap(self._center.x() - self._sprite.width() // 2,
+                           self._center.y() - self._sprite.height() // 2,
+                           self._sprite)
 
 class ModernSlider(QSlider):
     def __init__(self, *args, **kwargs):
@@ -349,6 +642,8 @@ class CustomCheckBox(QCheckBox):
     def __init__(self, text: str = '', parent=None):
         super().__init__(text, parent)
         self.check_pixmap = AsyncImageLoader.instance().get(IMGUR_CHECK_URL, self)
+        self._scaled: Optional[QPixmap] = None
+        self._scaled_for: Optional[QSize] = None
 
     def paintEvent(self, event):
         if self.check_pixmap is None:
@@ -359,22 +654,25 @@ class CustomCheckBox(QCheckBox):
         if self.isChecked() and self.check_pixmap and not self.check_pixmap.isNull():
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
-            
+
             box_size = 18
             y_offset = (self.height() - box_size) / 2
             target_rect = QRect(2, int(y_offset), box_size, box_size)
-            
-            image = self.check_pixmap.scaled(
-                target_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
-            painter.drawPixmap(target_rect, image)
+
+            # The box size is fixed, so the smooth downscale only needs to
+            # run once instead of resampling the glyph on every repaint.
+            if self._scaled is None or self._scaled_for != target_rect.size():
+                self._scaled = self.check_pixmap.scaled(
+                    target_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+                )
+                self._scaled.setDevicePixelRatio(self.devicePixelRatioF())
+                self._scaled_for = target_rect.size()
+            painter.drawPixmap(target_rect, self._scaled)
 
 
 
 class CloudRecoil(QWidget):
-    fps_updated = pyqtSignal(float)
     makcu_status_updated = pyqtSignal(str, str)
-    makcu_activity_signal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -389,6 +687,12 @@ class CloudRecoil(QWidget):
 
         self.activity_timer = QTimer(self)
         self.activity_timer.setSingleShot(True)
+        # Coalesces widget-change signals: a slider drag fires valueChanged
+        # per pixel, and each update_settings call costs a dict rebuild plus
+        # the AppState lock. One 20 ms single-shot batches the burst.
+        self.settings_debounce = QTimer(self)
+        self.settings_debounce.setSingleShot(True)
+        self.settings_debounce.setInterval(20)
         self.animation: Optional[QPropertyAnimation] = None
         self.crosshair: Optional[CrosshairWindow] = None
         self.drag_pos = QPoint()
@@ -398,47 +702,121 @@ class CloudRecoil(QWidget):
         self.init_crosshair()
         self.init_threads()
 
-    def recoil_loop(self):
+    TICK_INTERVAL_MS = 2
+    IDLE_INTERVAL_MS = 20
+    BLOOM_POOL_SIZE = 256
+    BLOOM_POOL_SIZE_VEC = 4096
+
+    def _init_recoil_state(self):
+        # Sub-steps of a software-mouse burst queued for the following ticks,
+        # so smoothing needs no sleeps of its own.
+        self._burst_moves: List = []
+        self._burst_index = 0
+
+        # Step tables rebuilt only when settings change: the fixed vertical
+        # pattern plus a ring of (dx_total, x_moves) bloom patterns, so a
+        # trigger burst costs a pool index instead of list building and RNG.
+        self._rng = random.Random()
+        self._np_rng = np.random.default_rng() if HAVE_NUMPY else None
+        self._cfg_gen = -1
+        self._cfg: Dict = {}
+        self._dy_total = 0
+        self._y_moves: tuple = ()
+        self._x_pool: tuple = ((0, ()),)
+        self._pool_mask = 0
+        self._pool_idx = 0
+
+        # Tick counter read and reset by update_fps_label; both sides run on
+        # the GUI thread, so a plain attribute is enough.
+        self._tick_count = 0
+
+    def _recoil_tick(self):
+        # Runs on the GUI thread from a PreciseTimer every 2 ms: no worker
+        # thread, no GIL hand-offs per iteration, and no queued signal
+        # marshalling for the activity indicator. Qt's multimedia-timer
+        # backing (plus the timeBeginPeriod(1) call at startup) gives the
+        # cadence that time.sleep could not.
+        if not self.app_state.running:
+            return
 
-        while self.app_state.running:
-            self.app_state.fps += 1
-            config = self.app_state.get_full_config()
+        self._tick_count += 1
+        self._cfg_gen, snapshot = self.app_state.get_if_changed(self._cfg_gen)
+        if snapshot is not None:
+            self._cfg = config = snapshot
+            smoothing = max(1, config['smoothing'])
+            self._dy_total = config['recoil_strength']
+            self._y_moves = tuple(distribute_movement(self._dy_total, smoothing))
+            bloom = config['bloom_intensity'] if config['bloom_reduction'] else 0
+            if bloom > 0:
+                if self._np_rng is not None:
+                    # NumPy's C bit generator fills the whole offset pool in
+                    # one vectorized int8 draw; the tiny dx range means every
+                    # entry shares one of 2*bloom+1 pre-distributed patterns.
+                    patterns = {
+                        dx: (dx, tuple(distribute_movement(dx, smoothing)))
+                        for dx in range(-bloom, bloom + 1)
+                    }
+                    offsets = self._np_rng.integers(
+                        -bloom, bloom + 1, size=self.BLOOM_POOL_SIZE_VEC,
+                        dtype=np.int8)
+                    self._x_pool = tuple(patterns[int(dx)] for dx in offsets)
+                else:
+                    self._x_pool = tuple(
+                        (dx, tuple(distribute_movement(dx, smoothing)))
+                        for dx in (self._rng.randint(-bloom, bloom)
+                                   for _ in range(self.BLOOM_POOL_SIZE))
+                    )
+            else:
+                self._x_pool = ((0, (0,) * smoothing),)
+            self._pool_mask = len(self._x_pool) - 1
+            self._pool_idx = 0
+        else:
+            config = self._cfg
+
+        # Coarse idle gate: with compensation off nothing can fire, so tick
+        # at 20 ms instead of 2 ms until the settings change re-arms us.
+        if not config.get('recoil_compensation', False):
+            # Drop any burst queued before the toggle: its sub-steps would
+            # otherwise replay as movement the moment the feature re-arms.
+            self._burst_moves = []
+            self._burst_index = 0
+            if self._recoil_timer.interval() != self.IDLE_INTERVAL_MS:
+                self._recoil_timer.setInterval(self.IDLE_INTERVAL_MS)
+            return
+        if self._recoil_timer.interval() != self.TICK_INTERVAL_MS:
+            self._recoil_timer.setInterval(self.TICK_INTERVAL_MS)
 
-            lmb_pressed = win32api.GetAsyncKeyState(win32con.VK_LBUTTON) < 0
-            ads_pressed = win32api.GetAsyncKeyState(win32con.VK_RBUTTON) < 0
+        if self._burst_index < len(self._burst_moves):
+            dx, dy = self._burst_moves[self._burst_index]
+            self._burst_index += 1
+            _mouse_event(win32con.MOUSEEVENTF_MOVE, dx, dy, 0, None)
+        else:
+            # LMB first: while it's up (the overwhelmingly common case) the
+            # ADS read and burst setup are skipped entirely.
+            lmb_pressed = _GetAsyncKeyState(win32con.VK_LBUTTON) < 0
 
-            is_recoil_active = (
-                lmb_pressed and 
-                config['recoil_compensation'] and
-                (not config['require_ads'] or ads_pressed)
+            is_recoil_active = lmb_pressed and (
+                not config['require_ads'] or
+                _GetAsyncKeyState(win32con.VK_RBUTTON) < 0
             )
 
             if is_recoil_active:
-                smoothing = max(1, config['smoothing'])
-                dy_total = config['recoil_strength']
-                dx_total = 0
-                if config['bloom_reduction']:
-                    dx_total = random.randint(-config['bloom_intensity'], config['bloom_intensity'])
-                
-                y_moves = distribute_movement(dy_total, smoothing)
-                x_moves = distribute_movement(dx_total, smoothing)
-
-                use_makcu = (config.get('use_makcu', False) and 
+                dx_total, x_moves = self._x_pool[self._pool_idx]
+                self._pool_idx = (self._pool_idx + 1) & self._pool_mask
+
+                use_makcu = (config.get('use_makcu', False) and
                              self.mouse_controller and self.mouse_controller.connected)
-                
-                for i in range(smoothing):
-                    dx = x_moves[i]
-                    dy = y_moves[i]
-                    
-                    if use_makcu:
-                        if self.mouse_controller.move(dx, dy):
-                            self.makcu_activity_signal.emit()
-                    else:
-                        win32api.mouse_event(win32con.MOUSEEVENTF_MOVE, dx, dy, 0, 0)
-                    
-                    time.sleep(0.001)
-
-            time.sleep(0.002)
+
+                if use_makcu:
+                    # The totals are known up front, so send the whole burst as one
+                    # serial write instead of N tiny ones; the device applies it at
+                    # its own pace and we skip N-1 USB round trips.
+                    if self.mouse_controller.move(dx_total, self._dy_total):
+                        self.on_makcu_activity()
+                else:
+                    _mouse_event(win32con.MOUSEEVENTF_MOVE, x_moves[0], self._y_moves[0], 0, None)
+                    self._burst_moves = list(zip(x_moves[1:], self._y_moves[1:]))
+                    self._burst_index = 0
 
 
     def init_ui(self):
@@ -455,10 +833,9 @@ class CloudRecoil(QWidget):
         main_layout.addWidget(self._create_slider_panel())
         main_layout.addWidget(self._create_crosshair_panel())
         
-        self.fps_updated.connect(lambda fps: self.fps_label.setText(f'FPS: {fps:.0f}'))
         self.makcu_status_updated.connect(self.update_makcu_status_label)
-        self.makcu_activity_signal.connect(self.on_makcu_activity)
         self.activity_timer.timeout.connect(self.on_activity_timeout)
+        self.settings_debounce.timeout.connect(self.update_settings)
         
     def init_animation(self):
         self.animation = QPropertyAnimation(self, b'windowOpacity')
@@ -474,9 +851,16 @@ class CloudRecoil(QWidget):
     def init_threads(self):
         if self.checkboxes['use_makcu'].isChecked():
             self.on_makcu_toggled(Qt.Checked)
-        
-        self.recoil_thread = threading.Thread(target=self.recoil_loop, daemon=True)
-        self.recoil_thread.start()
+
+        # Raise the system timer resolution once so the 2 ms PreciseTimer
+        # below really fires at 2 ms; restored in closeEvent.
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        self._init_recoil_state()
+        self._recoil_timer = QTimer(self)
+        self._recoil_timer.setTimerType(Qt.PreciseTimer)
+        self._recoil_timer.timeout.connect(self._recoil_tick)
+        self._recoil_timer.start(self.TICK_INTERVAL_MS)
+
         self.fps_timer = QTimer(self)
         self.fps_timer.timeout.connect(self.update_fps_label)
         self.fps_timer.start(1000)
@@ -508,7 +892,7 @@ class CloudRecoil(QWidget):
         status_layout.addWidget(self.fps_label, 0, Qt.AlignRight)
         status_layout.addLayout(makcu_layout)
 
-        discord_pixmap = svg_to_pixmap(DISCORD_SVG, QSize(22, 22))
+        discord_pixmap = discord_icon_pixmap()
         discord_button = QPushButton(QIcon(discord_pixmap), '', self)
         discord_button.setToolTip('Join Discord')
         discord_button.clicked.connect(lambda: QDesktopServices.openUrl(QUrl(DISCORD_INVITE_URL)))
@@ -556,7 +940,7 @@ class CloudRecoil(QWidget):
                     checkbox.setEnabled(False)
                     checkbox.setToolTip("Please install 'pyserial' to use this feature.")
             else:
-                checkbox.stateChanged.connect(self.update_settings)
+                checkbox.stateChanged.connect(self._schedule_update)
 
             layout.addWidget(checkbox)
             self.checkboxes[key] = checkbox
@@ -637,7 +1021,7 @@ class CloudRecoil(QWidget):
         value_label.setAlignment(Qt.AlignRight)
         
         slider.valueChanged.connect(lambda value, lbl=value_label: lbl.setText(str(value)))
-        slider.valueChanged.connect(self.update_settings)
+        slider.valueChanged.connect(self._schedule_update)
         
         h_layout.addWidget(label)
         h_layout.addStretch()
@@ -649,11 +1033,13 @@ class CloudRecoil(QWidget):
 
     def closeEvent(self, event):
         print("Closing application...")
+        self.app_state.running = False
+        self._recoil_timer.stop()
+        ctypes.windll.winmm.timeEndPeriod(1)
         if self.mouse_controller:
             self.mouse_controller.close()
-            
+
         Config.save(self.app_state.get_full_config())
-        self.app_state.running = False
         self.crosshair.close()
         super().closeEvent(event)
 
@@ -694,6 +1080,9 @@ class CloudRecoil(QWidget):
         super().update()
         self.update_close_button_icon()
             
+    def _schedule_update(self, *_):
+        self.settings_debounce.start()
+
     def update_settings(self):
         settings = {key: cb.isChecked() for key, cb in self.checkboxes.items()}
         settings.update({key: slider.value() for key, slider in self.sliders.items()})
@@ -727,8 +1116,8 @@ class CloudRecoil(QWidget):
         self.activity_indicator.setStyleSheet(STYLES["activity_off"])
 
     def update_fps_label(self):
-        self.fps_updated.emit(self.app_state.fps)
-        self.app_state.fps = 0
+        self.fps_label.setText(f'FPS: {self._tick_count:.0f}')
+        self._tick_count = 0
 
     def update_makcu_status_label(self, text: str, style_key: str):
         self.makcu_status_label.setText(text)